@@ -0,0 +1,64 @@
+"""
+JSON codec shared by the blockchain and voting system persistence code.
+
+Uses orjson when it is installed and can represent the value losslessly,
+otherwise the stdlib json module. The two encoders do not produce identical
+bytes (the stdlib escapes non-ASCII text), but every document written by
+either one loads back to the same value.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    orjson = None
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to a two-space indented JSON document.
+    
+    orjson rejects lone surrogates and silently writes non-finite floats as
+    null, so those values are written with the stdlib encoder instead.
+    
+    Args:
+        obj: JSON-serializable object
+    
+    Returns:
+        JSON document as UTF-8 bytes
+    """
+    if orjson is not None:
+        try:
+            data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            data = None
+        # A non-finite float always shows up as a bare null; a null inside a
+        # string or a genuine None only costs a redundant stdlib encode.
+        if data is not None and b'null' not in data:
+            return data
+    return json.dumps(obj, indent=2, separators=(',', ': ')).encode('utf-8')
+
+
+def loads(data: bytes) -> Any:
+    """
+    Parse a JSON document.
+    
+    Args:
+        data: JSON document as UTF-8 bytes
+    
+    Returns:
+        Decoded object
+    
+    Raises:
+        ValueError: If data is not valid JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Infinity, NaN and escaped lone surrogates are only accepted by
+            # the stdlib decoder, which also reports genuinely invalid input
+            pass
+    return json.loads(data)
@@ -2,8 +2,8 @@
 Block data class for representing blocks in the blockchain.
 """
 
-from dataclasses import dataclass
-from typing import List, Dict, Any
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Tuple
 import hashlib
 import json
 import time
@@ -27,6 +27,9 @@ class Block:
     votes: List[Vote]
     previous_hash: str
     hash: str = ""
+    _validation_cache: Optional[Tuple[tuple, bool]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     def __post_init__(self):
         """Calculate hash if not provided and validate block data."""
@@ -66,7 +69,8 @@ class Block:
         # Convert to JSON string with sorted keys for consistency
         block_string = json.dumps(block_data, sort_keys=True, separators=(',', ':'))
         
-        # Calculate SHA-256 hash
+        # Hash the whole serialization in a single call so OpenSSL processes one
+        # contiguous buffer. The hex digest format is part of the persisted chain.
         return hashlib.sha256(block_string.encode('utf-8')).hexdigest()
     
     def to_dict(self) -> Dict[str, Any]:
@@ -135,11 +139,42 @@ class Block:
             previous_hash=previous_hash
         )
     
+    def _validation_key(self) -> tuple:
+        """
+        Build a snapshot of every field that feeds into the block hash.
+        
+        Types are included alongside numeric values because, for example,
+        1 and 1.0 compare equal but serialize (and therefore hash) differently.
+        
+        Returns:
+            Tuple that changes whenever the hashed block data or stored hash changes
+        """
+        return (
+            self.hash,
+            type(self.index), self.index,
+            type(self.timestamp), self.timestamp,
+            self.previous_hash,
+            tuple(
+                (vote.voter_id, vote.candidate, type(vote.timestamp), vote.timestamp)
+                for vote in self.votes
+            )
+        )
+    
     def validate_hash(self) -> bool:
         """
         Validate that the stored hash matches the calculated hash.
         
+        The outcome is cached against a snapshot of the hashed fields, so an
+        unchanged block is not re-serialized and re-hashed on every validation,
+        while any change to the block or its votes forces a recalculation.
+        
         Returns:
             True if hash is valid, False otherwise
         """
-        return self.hash == self.calculate_hash()
\ No newline at end of file
+        key = self._validation_key()
+        if self._validation_cache is not None and self._validation_cache[0] == key:
+            return self._validation_cache[1]
+        
+        is_valid = self.hash == self.calculate_hash()
+        self._validation_cache = (key, is_valid)
+        return is_valid
\ No newline at end of file
@@ -2,9 +2,9 @@
 Blockchain class for managing the chain of blocks in the voting system.
 """
 
-from typing import List, Dict, Any, Optional
-import json
+from typing import List, Dict, Any, Optional, Iterator
 import os
+from blockchain_voting import _json
 from blockchain_voting.blockchain.block import Block
 from blockchain_voting.voting.vote import Vote
 
@@ -139,6 +139,16 @@ class Blockchain:
             all_votes.extend(block.votes)
         return all_votes
     
+    def iter_all_votes(self) -> Iterator[Vote]:
+        """
+        Iterate over all votes in the blockchain without building a list.
+        
+        Yields:
+            Each vote, in block order
+        """
+        for block in self.chain:
+            yield from block.votes
+    
     def get_block_count(self) -> int:
         """
         Get the number of blocks in the blockchain.
@@ -212,9 +222,9 @@ class Blockchain:
             True if save was successful, False otherwise
         """
         try:
-            blockchain_dict = self.to_dict()
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(blockchain_dict, f, indent=2, separators=(',', ': '))
+            data = _json.dumps(self.to_dict())
+            with open(filename, 'wb') as f:
+                f.write(data)
             return True
         except Exception:
             return False
@@ -233,8 +243,9 @@ class Blockchain:
             if not os.path.exists(filename):
                 return False
             
-            with open(filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(filename, 'rb') as f:
+                raw = f.read()
+            data = _json.loads(raw)
             
             loaded_blockchain = self.from_dict(data)
             
@@ -17,6 +17,10 @@ class Vote:
         candidate: The candidate or option being voted for
         timestamp: Unix timestamp when the vote was cast
     """
+    # Slots drop the per-instance __dict__; fields have no defaults, so this
+    # works with plain @dataclass on every supported Python version.
+    __slots__ = ('voter_id', 'candidate', 'timestamp')
+    
     voter_id: str
     candidate: str
     timestamp: float
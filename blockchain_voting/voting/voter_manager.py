@@ -2,7 +2,7 @@
 VoterManager class for handling voter registration and voting status tracking.
 """
 
-from typing import Set, List, Dict, Any
+from typing import Set, FrozenSet, List, Dict, Any, Iterable, Optional
 
 
 class VoterManager:
@@ -17,6 +17,8 @@ class VoterManager:
         """Initialize VoterManager with empty voter sets."""
         self._registered_voters: Set[str] = set()
         self._voted_voters: Set[str] = set()
+        # Snapshot returned by get_registered_voter_set, rebuilt after registrations
+        self._registered_snapshot: Optional[FrozenSet[str]] = None
     
     def register_voter(self, voter_id: str) -> bool:
         """
@@ -38,8 +40,43 @@ class VoterManager:
             return False
         
         self._registered_voters.add(voter_id)
+        self._registered_snapshot = None
         return True
     
+    def register_new_voters(self, voter_ids: Iterable[str]) -> List[str]:
+        """
+        Register every voter ID in the batch that is not registered yet.
+        
+        The batch is all-or-nothing for invalid IDs: all IDs are validated
+        before any is registered, and a single invalid ID raises without
+        changing the registry. Already registered and repeated IDs are not
+        errors; they are skipped and left out of the return value.
+        VotingSystem.register_voters instead handles each ID on its own and
+        reports per-ID failures.
+        
+        Args:
+            voter_ids: Voter IDs to register
+            
+        Returns:
+            Newly registered voter IDs in input order
+            
+        Raises:
+            ValueError: If any voter_id is invalid (empty or not string)
+        """
+        voter_ids = list(voter_ids)
+        for voter_id in voter_ids:
+            if not voter_id or not isinstance(voter_id, str):
+                raise ValueError("voter_id must be a non-empty string")
+        
+        new_voters = [
+            voter_id for voter_id in dict.fromkeys(voter_ids)
+            if voter_id not in self._registered_voters
+        ]
+        if new_voters:
+            self._registered_voters.update(new_voters)
+            self._registered_snapshot = None
+        return new_voters
+    
     def is_registered(self, voter_id: str) -> bool:
         """
         Check if a voter is registered.
@@ -97,6 +134,20 @@ class VoterManager:
         """
         return sorted(list(self._registered_voters))
     
+    def get_registered_voter_set(self) -> FrozenSet[str]:
+        """
+        Get the registered voter IDs as an immutable set.
+        
+        The same frozenset is returned until the next registration, so repeated
+        membership or equality checks do not rebuild it.
+        
+        Returns:
+            Frozenset of registered voter IDs
+        """
+        if self._registered_snapshot is None:
+            self._registered_snapshot = frozenset(self._registered_voters)
+        return self._registered_snapshot
+    
     def get_voted_voters(self) -> List[str]:
         """
         Get list of all voters who have voted.
@@ -187,4 +238,5 @@ class VoterManager:
         Clear all voter data (for testing purposes).
         """
         self._registered_voters.clear()
-        self._voted_voters.clear()
\ No newline at end of file
+        self._voted_voters.clear()
+        self._registered_snapshot = None
\ No newline at end of file
@@ -2,10 +2,11 @@
 VotingSystem class for orchestrating the entire voting process.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, BinaryIO
+from collections import Counter
 import time
-import json
 import os
+from blockchain_voting import _json
 from blockchain_voting.blockchain.blockchain import Blockchain
 from blockchain_voting.voting.voter_manager import VoterManager
 from blockchain_voting.voting.vote import Vote
@@ -24,6 +25,17 @@ class VotingSystem:
         self.voter_manager = VoterManager()
         self.pending_votes: List[Vote] = []
     
+    def reset(self) -> None:
+        """
+        Return the system to its freshly initialized state.
+        
+        Clears voter registrations and pending votes in place and replaces the
+        blockchain with a new chain holding only a genesis block.
+        """
+        self.blockchain = Blockchain()
+        self.voter_manager.clear()
+        self.pending_votes.clear()
+    
     def register_voter(self, voter_id: str) -> Dict[str, Any]:
         """
         Register a new voter with unique ID validation.
@@ -116,6 +128,73 @@ class VotingSystem:
                 "message": f"Failed to cast vote: {str(e)}"
             }
     
+    def register_voters(self, voter_ids: List[str]) -> Dict[str, Any]:
+        """
+        Register several voters in a single call.
+        
+        Each voter ID goes through the same validation as register_voter; a
+        failed registration (invalid or duplicate ID) does not stop the
+        remaining ones and is reported in "failures".
+        
+        Args:
+            voter_ids: Unique identifiers of the voters to register
+            
+        Returns:
+            Dictionary with success status, registered voter IDs and failures
+        """
+        registered = []
+        failures = []
+        for voter_id in voter_ids:
+            result = self.register_voter(voter_id)
+            if result["success"]:
+                registered.append(voter_id)
+            else:
+                failures.append({
+                    "voter_id": voter_id,
+                    "error": result["error"],
+                    "message": result["message"]
+                })
+        
+        return {
+            "success": not failures,
+            "message": f"Registered {len(registered)} of {len(registered) + len(failures)} voters",
+            "registered": registered,
+            "failures": failures
+        }
+    
+    def cast_votes(self, votes: List[Tuple[str, str]]) -> Dict[str, Any]:
+        """
+        Cast several votes in a single call.
+        
+        Each (voter_id, candidate) pair goes through the same validation as
+        cast_vote; a rejected vote does not stop the remaining ones.
+        
+        Args:
+            votes: Pairs of voter ID and candidate
+            
+        Returns:
+            Dictionary with success status, voter IDs whose votes were cast and failures
+        """
+        cast = []
+        failures = []
+        for voter_id, candidate in votes:
+            result = self.cast_vote(voter_id, candidate)
+            if result["success"]:
+                cast.append(voter_id)
+            else:
+                failures.append({
+                    "voter_id": voter_id,
+                    "error": result["error"],
+                    "message": result["message"]
+                })
+        
+        return {
+            "success": not failures,
+            "message": f"Cast {len(cast)} of {len(cast) + len(failures)} votes",
+            "cast": cast,
+            "failures": failures
+        }
+    
     def create_block_from_pending_votes(self) -> Dict[str, Any]:
         """
         Create a new block from pending votes and add it to the blockchain.
@@ -238,8 +317,8 @@ class VotingSystem:
                 "total_blocks": self.blockchain.get_block_count(),
                 "total_votes": len(all_votes),
                 "pending_votes": len(self.pending_votes),
-                "registered_voters": len(self.get_registered_voters()),
-                "voted_voters": len(self.get_voted_voters())
+                "registered_voters": self.voter_manager.get_registration_count(),
+                "voted_voters": self.voter_manager.get_voted_count()
             }
             
         except Exception as e:
@@ -296,6 +375,53 @@ class VotingSystem:
         
         return voting_system
     
+    def _encode_state(self) -> bytes:
+        """
+        Serialize the voting system state to UTF-8 encoded JSON.
+        
+        Returns:
+            JSON document as bytes
+        """
+        return _json.dumps(self.to_dict())
+    
+    def _restore_state(self, data: bytes) -> Dict[str, Any]:
+        """
+        Decode serialized state and replace the current state with it.
+        
+        The current state is only replaced if the decoded blockchain is valid.
+        
+        Args:
+            data: JSON document produced by _encode_state
+            
+        Returns:
+            Dictionary with success status and validation results
+            
+        Raises:
+            KeyError: If required keys are missing
+            ValueError: If data is not valid JSON or contains invalid state
+        """
+        data = _json.loads(data)
+        loaded_system = self.from_dict(data)
+        
+        # Validate the loaded system
+        validation_result = loaded_system.validate_system_integrity()
+        if not validation_result.get('blockchain_valid', False):
+            return {
+                "success": False,
+                "error": "INVALID_BLOCKCHAIN",
+                "message": "Loaded blockchain is invalid"
+            }
+        
+        # Replace current state with loaded state
+        self.blockchain = loaded_system.blockchain
+        self.voter_manager = loaded_system.voter_manager
+        self.pending_votes = loaded_system.pending_votes
+        
+        return {
+            "success": True,
+            "validation": validation_result
+        }
+    
     def save_state(self, filename: str) -> Dict[str, Any]:
         """
         Save the entire voting system state to a JSON file.
@@ -307,9 +433,8 @@ class VotingSystem:
             Dictionary with success status and message
         """
         try:
-            system_dict = self.to_dict()
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(system_dict, f, indent=2, separators=(',', ': '))
+            with open(filename, 'wb') as f:
+                f.write(self._encode_state())
             
             return {
                 "success": True,
@@ -324,6 +449,31 @@ class VotingSystem:
                 "message": f"Failed to save system state: {str(e)}"
             }
     
+    def save_state_to_stream(self, stream: BinaryIO) -> Dict[str, Any]:
+        """
+        Save the entire voting system state to a binary stream as JSON.
+        
+        Args:
+            stream: Writable binary file-like object (e.g. io.BytesIO)
+            
+        Returns:
+            Dictionary with success status and message
+        """
+        try:
+            stream.write(self._encode_state())
+            
+            return {
+                "success": True,
+                "message": "System state saved to stream"
+            }
+            
+        except Exception as e:
+            return {
+                "success": False,
+                "error": "SAVE_ERROR",
+                "message": f"Failed to save system state: {str(e)}"
+            }
+    
     def load_state(self, filename: str) -> Dict[str, Any]:
         """
         Load voting system state from a JSON file.
@@ -342,30 +492,46 @@ class VotingSystem:
                     "message": f"File {filename} does not exist"
                 }
             
-            with open(filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(filename, 'rb') as f:
+                result = self._restore_state(f.read())
             
-            loaded_system = self.from_dict(data)
-            
-            # Validate the loaded system
-            validation_result = loaded_system.validate_system_integrity()
-            if not validation_result.get('blockchain_valid', False):
-                return {
-                    "success": False,
-                    "error": "INVALID_BLOCKCHAIN",
-                    "message": "Loaded blockchain is invalid"
-                }
-            
-            # Replace current state with loaded state
-            self.blockchain = loaded_system.blockchain
-            self.voter_manager = loaded_system.voter_manager
-            self.pending_votes = loaded_system.pending_votes
+            if not result["success"]:
+                return result
             
             return {
                 "success": True,
                 "message": f"System state loaded from {filename}",
                 "filename": filename,
-                "validation": validation_result
+                "validation": result["validation"]
+            }
+            
+        except Exception as e:
+            return {
+                "success": False,
+                "error": "LOAD_ERROR",
+                "message": f"Failed to load system state: {str(e)}"
+            }
+    
+    def load_state_from_stream(self, stream: BinaryIO) -> Dict[str, Any]:
+        """
+        Load voting system state from a binary stream containing JSON.
+        
+        Args:
+            stream: Readable binary file-like object (e.g. io.BytesIO)
+            
+        Returns:
+            Dictionary with success status and message
+        """
+        try:
+            result = self._restore_state(stream.read())
+            
+            if not result["success"]:
+                return result
+            
+            return {
+                "success": True,
+                "message": "System state loaded from stream",
+                "validation": result["validation"]
             }
             
         except Exception as e:
@@ -383,17 +549,8 @@ class VotingSystem:
             Dictionary with vote counts, totals, and validation status
         """
         try:
-            # Get all votes from blockchain
-            all_votes = self.blockchain.get_all_votes()
-            
-            # Count votes by candidate
-            vote_counts = {}
-            for vote in all_votes:
-                candidate = vote.candidate
-                if candidate in vote_counts:
-                    vote_counts[candidate] += 1
-                else:
-                    vote_counts[candidate] = 1
+            # Count votes by candidate (Counter tallies in C, in first-seen order)
+            vote_counts = dict(Counter(vote.candidate for vote in self.blockchain.iter_all_votes()))
             
             # Calculate total votes
             total_votes = sum(vote_counts.values())
@@ -402,8 +559,8 @@ class VotingSystem:
             validation_result = self.validate_system_integrity()
             
             # Get additional statistics
-            registered_count = len(self.get_registered_voters())
-            voted_count = len(self.get_voted_voters())
+            registered_count = self.voter_manager.get_registration_count()
+            voted_count = self.voter_manager.get_voted_count()
             pending_count = len(self.pending_votes)
             
             return {
@@ -437,14 +594,15 @@ class VotingSystem:
             Dictionary with candidate vote details
         """
         try:
-            all_votes = self.blockchain.get_all_votes()
-            candidate_votes = [vote for vote in all_votes if vote.candidate == candidate]
+            candidate_votes = [
+                vote.to_dict() for vote in self.blockchain.iter_all_votes() if vote.candidate == candidate
+            ]
             
             return {
                 "success": True,
                 "candidate": candidate,
                 "vote_count": len(candidate_votes),
-                "votes": [vote.to_dict() for vote in candidate_votes]
+                "votes": candidate_votes
             }
             
         except Exception as e:
@@ -462,9 +620,7 @@ class VotingSystem:
             List of candidate names (sorted)
         """
         try:
-            all_votes = self.blockchain.get_all_votes()
-            candidates = set(vote.candidate for vote in all_votes)
-            return sorted(list(candidates))
+            return sorted({vote.candidate for vote in self.blockchain.iter_all_votes()})
         except Exception:
             return []
     
@@ -3,6 +3,7 @@
 Test runner for blockchain voting system.
 """
 
+import importlib.util
 import unittest
 import sys
 import os
@@ -10,8 +11,20 @@ import os
 # Add the project root to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+def run_tests_parallel():
+    """Run all tests across CPU cores with pytest-xdist."""
+    if importlib.util.find_spec('pytest') is None or importlib.util.find_spec('xdist') is None:
+        print("Parallel runs need pytest and pytest-xdist: pip install pytest pytest-xdist")
+        return 1
+    
+    import pytest
+    return int(pytest.main(['-n', 'auto', 'tests']))
+
 def run_tests():
     """Run all unit tests."""
+    if '--parallel' in sys.argv[1:]:
+        return run_tests_parallel()
+    
     # Discover and run tests
     loader = unittest.TestLoader()
     start_dir = 'tests'
@@ -66,6 +66,20 @@ class TestBlock(unittest.TestCase):
         self.assertEqual(hash1, hash2)
         self.assertEqual(hash1, block.hash)
     
+    def test_calculate_hash_known_value(self):
+        """Test the hash format stays stable so saved blockchains remain valid."""
+        block = Block(
+            1,
+            1700000000.5,
+            [Vote("voter1", "Alice", 1700000000.25), Vote("voter2", "Bob", 1700000001.0)],
+            "0" * 64
+        )
+        
+        self.assertEqual(
+            block.calculate_hash(),
+            "5e7651dc6aff2f9369d3b3c5afd246a34cedc420d3a5fedef13cc9477fe9d4c9"
+        )
+    
     def test_to_dict(self):
         """Test block serialization to dictionary."""
         block = Block(
@@ -126,6 +140,29 @@ class TestBlock(unittest.TestCase):
         # Corrupted hash should fail validation
         block.hash = "invalid_hash"
         self.assertFalse(block.validate_hash())
+    
+    def test_validate_hash_detects_changes_after_cached_result(self):
+        """Test a cached validation result is not reused once block data changes."""
+        block = Block(
+            self.valid_index,
+            self.valid_timestamp,
+            self.valid_votes,
+            self.valid_previous_hash
+        )
+        self.assertTrue(block.validate_hash())
+        self.assertTrue(block.validate_hash())
+        
+        # Tampering with a vote in place should be detected
+        block.votes[0].candidate = "Mallory"
+        self.assertFalse(block.validate_hash())
+        
+        # Restoring the vote makes the block valid again
+        block.votes[0].candidate = "Alice"
+        self.assertTrue(block.validate_hash())
+        
+        # Changing a numeric field's type changes the serialized data
+        block.index = float(block.index)
+        self.assertFalse(block.validate_hash())
 
 
 if __name__ == '__main__':
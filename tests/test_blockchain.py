@@ -6,10 +6,16 @@ import unittest
 import tempfile
 import os
 import time
+from unittest import mock
+from blockchain_voting import _json
 from blockchain_voting.blockchain.blockchain import Blockchain
 from blockchain_voting.blockchain.block import Block
 from blockchain_voting.voting.vote import Vote
 
+# Run the persistence round trips under the stdlib codec and, when it is
+# installed, under orjson
+CODECS = [("json", None)] + ([("orjson", _json.orjson)] if _json.orjson is not None else [])
+
 
 class TestBlockchain(unittest.TestCase):
     """Test cases for Blockchain class."""
@@ -113,6 +119,15 @@ class TestBlockchain(unittest.TestCase):
         all_votes = self.blockchain.get_all_votes()
         self.assertEqual(len(all_votes), 3)  # 2 + 1 votes
     
+    def test_iter_all_votes(self):
+        """Test iterating over all votes matches get_all_votes."""
+        self.assertEqual(list(self.blockchain.iter_all_votes()), [])
+        
+        self.blockchain.add_block(self.sample_votes)
+        self.blockchain.add_block([Vote("voter3", "Charlie", time.time())])
+        
+        self.assertEqual(list(self.blockchain.iter_all_votes()), self.blockchain.get_all_votes())
+    
     def test_get_block_count(self):
         """Test getting block count."""
         self.assertEqual(self.blockchain.get_block_count(), 1)  # Genesis block
@@ -192,6 +207,54 @@ class TestBlockchain(unittest.TestCase):
             if os.path.exists(temp_filename):
                 os.unlink(temp_filename)
     
+    def test_save_and_load_file_stdlib_json(self):
+        """Test saving and loading blockchain from file when orjson is unavailable."""
+        self.blockchain.add_block(self.sample_votes)
+        
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
+            temp_filename = f.name
+        
+        try:
+            with mock.patch.object(_json, "orjson", None):
+                self.assertTrue(self.blockchain.save_to_file(temp_filename))
+                new_blockchain = Blockchain()
+                self.assertTrue(new_blockchain.load_from_file(temp_filename))
+            
+            self.assertEqual(new_blockchain.to_dict(), self.blockchain.to_dict())
+            
+            # Files written by either codec can be read by the other
+            self.assertTrue(Blockchain().load_from_file(temp_filename))
+            
+        finally:
+            if os.path.exists(temp_filename):
+                os.unlink(temp_filename)
+    
+    def _assert_file_round_trip(self, votes):
+        """Save a block of votes and load it back under every available codec."""
+        self.blockchain.add_block(votes)
+        
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
+            temp_filename = f.name
+        
+        try:
+            for name, codec in CODECS:
+                with self.subTest(codec=name), mock.patch.object(_json, "orjson", codec):
+                    self.assertTrue(self.blockchain.save_to_file(temp_filename))
+                    new_blockchain = Blockchain()
+                    self.assertTrue(new_blockchain.load_from_file(temp_filename))
+                    self.assertEqual(new_blockchain.to_dict(), self.blockchain.to_dict())
+        finally:
+            if os.path.exists(temp_filename):
+                os.unlink(temp_filename)
+    
+    def test_save_and_load_file_non_finite_timestamp(self):
+        """Test a non-finite vote timestamp survives a file round trip."""
+        self._assert_file_round_trip([Vote("voter1", "Alice", float("inf"))])
+    
+    def test_save_and_load_file_lone_surrogate(self):
+        """Test a voter_id containing a lone surrogate survives a file round trip."""
+        self._assert_file_round_trip([Vote("voter\ud800", "Alice", time.time())])
+    
     def test_load_nonexistent_file(self):
         """Test loading from nonexistent file."""
         result = self.blockchain.load_from_file("nonexistent_file.json")
@@ -3,21 +3,64 @@ Example property-based tests using hypothesis.
 This demonstrates the testing framework setup for future property tests.
 """
 
+import io
+import itertools
+import operator
+import os
+import tempfile
 import unittest
-from hypothesis import given, strategies as st
+import uuid
+from collections import Counter
+from hypothesis import given, settings, HealthCheck, Phase, strategies as st
+from hypothesis.stateful import RuleBasedStateMachine, rule, invariant
 from blockchain_voting.voting.vote import Vote
 from blockchain_voting.blockchain.block import Block
 from blockchain_voting.blockchain.blockchain import Blockchain
 from blockchain_voting.voting.voting_system import VotingSystem
 
 
+# Shared strategies, built once at import time and reused across properties
+ALNUM = st.characters(whitelist_categories=('Lu', 'Ll', 'Nd'))
+TS = st.floats(min_value=1.0, max_value=2147483647.0)
+
+
+def short_text(min_size, max_size):
+    """Alphanumeric text strategy used for voter IDs and candidate names."""
+    return st.text(min_size=min_size, max_size=max_size, alphabet=ALNUM)
+
+
+VOTE = st.builds(Vote, voter_id=short_text(1, 20), candidate=short_text(1, 20), timestamp=TS)
+VOTE_WIDE = st.builds(Vote, voter_id=short_text(1, 50), candidate=short_text(1, 50), timestamp=TS)
+
+# Properties 8-10 run ~10 sub-steps with block hashing and full-state
+# serialization per example; cap the example count, skip shrinking and
+# don't write examples to the on-disk database.
+SLOW_PROPERTY = settings(
+    max_examples=25,
+    deadline=None,
+    database=None,
+    suppress_health_check=[HealthCheck.too_slow],
+    phases=(Phase.explicit, Phase.reuse, Phase.generate, Phase.target)
+)
+
+# Fields that must survive a save/load round trip unchanged
+RESULT_KEYS = ("vote_counts", "total_votes", "registered_voters", "voted_voters", "pending_votes", "total_blocks")
+VALIDATION_KEYS = ("blockchain_valid", "integrity_valid", "issues")
+VOTE_FIELDS = operator.attrgetter("voter_id", "candidate", "timestamp")
+VOTE_BALLOT = operator.attrgetter("voter_id", "candidate")
+
+
 class TestPropertyExamples(unittest.TestCase):
     """Example property-based tests to verify framework setup."""
     
+    def setUp(self):
+        """Set up a voting system that property examples reset and reuse."""
+        self.voting_system = VotingSystem()
+    
     @given(
         voter_id=st.text(min_size=1, max_size=50),
         candidate=st.text(min_size=1, max_size=50),
-        timestamp=st.floats(min_value=1.0, max_value=2147483647.0)
+        timestamp=TS
     )
     def test_vote_serialization_round_trip(self, voter_id, candidate, timestamp):
         """
@@ -39,15 +82,10 @@ class TestPropertyExamples(unittest.TestCase):
     
     @given(
         index=st.integers(min_value=0, max_value=1000),
-        timestamp=st.floats(min_value=1.0, max_value=2147483647.0),
+        timestamp=TS,
         previous_hash=st.text(min_size=64, max_size=64, alphabet='0123456789abcdef'),
         votes=st.lists(
-            st.builds(
-                Vote,
-                voter_id=st.text(min_size=1, max_size=50, alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd'))),
-                candidate=st.text(min_size=1, max_size=50, alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd'))),
-                timestamp=st.floats(min_value=1.0, max_value=2147483647.0)
-            ),
+            VOTE_WIDE,
             min_size=0,
             max_size=10
         )
@@ -96,12 +134,7 @@ class TestPropertyExamples(unittest.TestCase):
         num_blocks=st.integers(min_value=1, max_value=5),
         votes_per_block=st.lists(
             st.lists(
-                st.builds(
-                    Vote,
-                    voter_id=st.text(min_size=1, max_size=20, alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd'))),
-                    candidate=st.text(min_size=1, max_size=20, alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd'))),
-                    timestamp=st.floats(min_value=1.0, max_value=2147483647.0)
-                ),
+                VOTE,
                 min_size=0,
                 max_size=5
             ),
@@ -181,12 +214,7 @@ class TestPropertyExamples(unittest.TestCase):
     
     @given(
         votes_to_add=st.lists(
-            st.builds(
-                Vote,
-                voter_id=st.text(min_size=1, max_size=20, alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd'))),
-                candidate=st.text(min_size=1, max_size=20, alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd'))),
-                timestamp=st.floats(min_value=1.0, max_value=2147483647.0)
-            ),
+            VOTE,
             min_size=0,
             max_size=10
         )
@@ -279,8 +307,8 @@ class TestPropertyExamples(unittest.TestCase):
                            "Blockchain should remain valid after adding multiple blocks")
     
     @given(
-        voter_id=st.text(min_size=1, max_size=50, alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd'))),
-        candidate=st.text(min_size=1, max_size=50, alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd')))
+        voter_id=short_text(1, 50),
+        candidate=short_text(1, 50)
     )
     def test_vote_authorization_property_3(self, voter_id, candidate):
         """
@@ -291,8 +319,9 @@ class TestPropertyExamples(unittest.TestCase):
         For any voter ID and vote, the vote should be accepted if and only if 
         the voter is registered and has not voted before.
         """
-        # Create a fresh voting system
-        voting_system = VotingSystem()
+        # Reset the shared voting system
+        voting_system = self.voting_system
+        voting_system.reset()
         
         # Test 1: Unregistered voter should not be able to vote
         unregistered_result = voting_system.cast_vote(voter_id, candidate)
@@ -415,8 +444,8 @@ class TestPropertyExamples(unittest.TestCase):
     @given(
         votes_to_cast=st.lists(
             st.tuples(
-                st.text(min_size=1, max_size=20, alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd'))),
-                st.text(min_size=1, max_size=20, alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd')))
+                short_text(1, 20),
+                short_text(1, 20)
             ),
             min_size=1,
             max_size=10,
@@ -432,8 +461,9 @@ class TestPropertyExamples(unittest.TestCase):
         For any accepted vote, it should remain in pending votes until a block is created, 
         and then appear in the blockchain.
         """
-        # Create a fresh voting system
-        voting_system = VotingSystem()
+        # Reset the shared voting system
+        voting_system = self.voting_system
+        voting_system.reset()
         
         # Register all voters and cast their votes
         cast_votes = []
@@ -456,8 +486,8 @@ class TestPropertyExamples(unittest.TestCase):
                         "All cast votes should be in pending votes")
         
         # Verify each vote is in pending votes with correct data
-        pending_vote_data = [(v.voter_id, v.candidate) for v in pending_votes]
-        expected_vote_data = [(voter_id, candidate) for voter_id, candidate in votes_to_cast]
+        pending_vote_data = list(map(VOTE_BALLOT, pending_votes))
+        expected_vote_data = list(votes_to_cast)
         
         for expected_voter_id, expected_candidate in expected_vote_data:
             self.assertIn((expected_voter_id, expected_candidate), pending_vote_data,
@@ -489,7 +519,7 @@ class TestPropertyExamples(unittest.TestCase):
                         "All votes should now be in blockchain")
         
         # Verify each vote appears in blockchain with correct data
-        blockchain_vote_data = [(v.voter_id, v.candidate) for v in blockchain_votes_after]
+        blockchain_vote_data = list(map(VOTE_BALLOT, blockchain_votes_after))
         
         for expected_voter_id, expected_candidate in expected_vote_data:
             self.assertIn((expected_voter_id, expected_candidate), blockchain_vote_data,
@@ -506,7 +536,7 @@ class TestPropertyExamples(unittest.TestCase):
         self.assertEqual(len(block_votes), len(votes_to_cast),
                         "Latest block should contain all the votes that were pending")
         
-        block_vote_data = [(v.voter_id, v.candidate) for v in block_votes]
+        block_vote_data = list(map(VOTE_BALLOT, block_votes))
         for expected_voter_id, expected_candidate in expected_vote_data:
             self.assertIn((expected_voter_id, expected_candidate), block_vote_data,
                          f"Latest block should contain vote from {expected_voter_id} for {expected_candidate}")
@@ -589,11 +619,12 @@ class TestPropertyExamples(unittest.TestCase):
         self.assertEqual(results["total_votes"], total_expected,
                         f"Total vote count should be {total_expected}")
     
+    @SLOW_PROPERTY
     @given(
         votes_to_cast=st.lists(
             st.tuples(
-                st.text(min_size=1, max_size=20, alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd'))),
-                st.text(min_size=1, max_size=20, alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd')))
+                short_text(1, 20),
+                short_text(1, 20)
             ),
             min_size=1,
             max_size=15,
@@ -611,47 +642,34 @@ class TestPropertyExamples(unittest.TestCase):
         of votes cast for that candidate across all blocks, and the total should equal 
         the sum of all individual counts.
         """
-        # Create a fresh voting system
-        voting_system = VotingSystem()
+        # Reset the shared voting system
+        voting_system = self.voting_system
+        voting_system.reset()
         
         # Track expected vote counts manually
-        expected_candidate_counts = {}
+        expected_candidate_counts = Counter(candidate for _, candidate in votes_to_cast)
         all_cast_votes = []
         
         # Split votes across multiple blocks
         votes_per_block = len(votes_to_cast) // num_blocks
         remaining_votes = len(votes_to_cast) % num_blocks
+        block_sizes = [votes_per_block + (1 if b < remaining_votes else 0) for b in range(num_blocks)]
         
-        vote_index = 0
-        for block_num in range(num_blocks):
-            # Determine how many votes for this block
-            votes_for_this_block = votes_per_block
-            if block_num < remaining_votes:
-                votes_for_this_block += 1
-            
+        votes_iter = iter(votes_to_cast)
+        for block_num, votes_for_this_block in enumerate(block_sizes):
             # Skip if no votes for this block
             if votes_for_this_block == 0:
                 continue
                 
             # Get votes for this block
-            block_votes = votes_to_cast[vote_index:vote_index + votes_for_this_block]
-            vote_index += votes_for_this_block
+            block_votes = list(itertools.islice(votes_iter, votes_for_this_block))
             
             # Register voters and cast votes for this block
-            for voter_id, candidate in block_votes:
-                # Register voter
-                register_result = voting_system.register_voter(voter_id)
-                self.assertTrue(register_result["success"], 
-                               f"Registration should succeed for voter {voter_id}")
-                
-                # Cast vote
-                vote_result = voting_system.cast_vote(voter_id, candidate)
-                self.assertTrue(vote_result["success"], 
-                               f"Vote casting should succeed for voter {voter_id}")
-                
-                # Track expected counts
-                expected_candidate_counts[candidate] = expected_candidate_counts.get(candidate, 0) + 1
-                all_cast_votes.append((voter_id, candidate))
+            register_result = voting_system.register_voters([voter_id for voter_id, _ in block_votes])
+            self.assertFalse(register_result["failures"], "Registration should succeed for every voter")
+            vote_result = voting_system.cast_votes(block_votes)
+            self.assertFalse(vote_result["failures"], "Vote casting should succeed for every voter")
+            all_cast_votes.extend(block_votes)
             
             # Create block from pending votes (if any votes were cast)
             if len(block_votes) > 0:
@@ -667,16 +685,9 @@ class TestPropertyExamples(unittest.TestCase):
         
         actual_vote_counts = results["vote_counts"]
         
-        # Test 2: Each candidate's count should match expected count
-        for candidate, expected_count in expected_candidate_counts.items():
-            actual_count = actual_vote_counts.get(candidate, 0)
-            self.assertEqual(actual_count, expected_count,
-                           f"Vote count for candidate '{candidate}' should be {expected_count}, got {actual_count}")
-        
-        # Test 3: No extra candidates should appear in results
-        for candidate in actual_vote_counts:
-            self.assertIn(candidate, expected_candidate_counts,
-                         f"Candidate '{candidate}' appears in results but was not voted for")
+        # Test 2 & 3: Each candidate's count should match and no extra candidates should appear
+        self.assertEqual(dict(actual_vote_counts), dict(expected_candidate_counts),
+                         "Vote counts should match expected counts exactly, with no extra candidates")
         
         # Test 4: Total votes should equal sum of individual candidate counts
         expected_total = sum(expected_candidate_counts.values())
@@ -691,21 +702,15 @@ class TestPropertyExamples(unittest.TestCase):
                         "Reported total should equal sum of individual counts")
         
         # Test 5: Verify counts by manually traversing blockchain
-        all_blockchain_votes = voting_system.blockchain.get_all_votes()
-        manual_candidate_counts = {}
-        
-        for vote in all_blockchain_votes:
-            candidate = vote.candidate
-            manual_candidate_counts[candidate] = manual_candidate_counts.get(candidate, 0) + 1
+        manual_candidate_counts = Counter(vote.candidate for vote in voting_system.blockchain.iter_all_votes())
+        manual_total = sum(manual_candidate_counts.values())
         
         # Manual counts should match both expected and reported counts
-        self.assertEqual(len(all_blockchain_votes), expected_total,
-                        f"Blockchain should contain {expected_total} votes, found {len(all_blockchain_votes)}")
+        self.assertEqual(manual_total, expected_total,
+                        f"Blockchain should contain {expected_total} votes, found {manual_total}")
         
-        for candidate, expected_count in expected_candidate_counts.items():
-            manual_count = manual_candidate_counts.get(candidate, 0)
-            self.assertEqual(manual_count, expected_count,
-                           f"Manual count for candidate '{candidate}' should be {expected_count}, got {manual_count}")
+        self.assertEqual(manual_candidate_counts, expected_candidate_counts,
+                         "Manual blockchain counts should match expected counts")
         
         # Test 6: Verify individual candidate vote retrieval
         for candidate in expected_candidate_counts:
@@ -738,7 +743,7 @@ class TestPropertyExamples(unittest.TestCase):
             self.assertTrue(block_result["success"], "Extra block creation should succeed")
             
             # Update expected counts
-            expected_candidate_counts[new_candidate] = expected_candidate_counts.get(new_candidate, 0) + 1
+            expected_candidate_counts[new_candidate] += 1
             expected_total += 1
             
             # Verify updated counts
@@ -754,11 +759,8 @@ class TestPropertyExamples(unittest.TestCase):
                            f"New candidate should have 1 vote")
             
             # Verify all original counts are still correct
-            for candidate, expected_count in expected_candidate_counts.items():
-                if candidate != new_candidate:  # Skip the new candidate we just added
-                    actual_count = updated_vote_counts.get(candidate, 0)
-                    self.assertEqual(actual_count, expected_count,
-                                   f"Original candidate '{candidate}' count should remain {expected_count}")
+            self.assertEqual(dict(updated_vote_counts), dict(expected_candidate_counts),
+                           "Original candidate counts should be unchanged by the extra vote")
         
         # Test 8: Verify system integrity is maintained throughout
         integrity_result = voting_system.validate_system_integrity()
@@ -767,12 +769,8 @@ class TestPropertyExamples(unittest.TestCase):
         self.assertTrue(integrity_result["integrity_valid"], "System integrity should remain valid")
         
         # Test 9: Verify consistency across different query methods
-        all_candidates = voting_system.get_all_candidates()
-        expected_candidates = set(expected_candidate_counts.keys())
-        actual_candidates = set(all_candidates)
-        
-        self.assertEqual(actual_candidates, expected_candidates,
-                        f"get_all_candidates() should return {expected_candidates}, got {actual_candidates}")
+        self.assertEqual(set(voting_system.get_all_candidates()), set(expected_candidate_counts),
+                        "get_all_candidates() should return exactly the voted-for candidates")
         
         # Test 10: Edge case - verify empty candidate handling
         # Try to get votes for a candidate that doesn't exist
@@ -785,11 +783,12 @@ class TestPropertyExamples(unittest.TestCase):
         self.assertEqual(len(nonexistent_result["votes"]), 0,
                        "Nonexistent candidate should have empty votes list")
     
+    @SLOW_PROPERTY
     @given(
         votes_to_cast=st.lists(
             st.tuples(
-                st.text(min_size=1, max_size=20, alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd'))),
-                st.text(min_size=1, max_size=20, alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd')))
+                short_text(1, 20),
+                short_text(1, 20)
             ),
             min_size=0,
             max_size=10,
@@ -805,20 +804,15 @@ class TestPropertyExamples(unittest.TestCase):
         For any results query, the response should include both vote counts and 
         the current blockchain validation status.
         """
-        # Create a fresh voting system
-        voting_system = VotingSystem()
+        # Reset the shared voting system
+        voting_system = self.voting_system
+        voting_system.reset()
         
         # Register voters and cast votes (if any)
-        for voter_id, candidate in votes_to_cast:
-            # Register voter
-            register_result = voting_system.register_voter(voter_id)
-            self.assertTrue(register_result["success"], 
-                           f"Registration should succeed for voter {voter_id}")
-            
-            # Cast vote
-            vote_result = voting_system.cast_vote(voter_id, candidate)
-            self.assertTrue(vote_result["success"], 
-                           f"Vote casting should succeed for voter {voter_id}")
+        register_result = voting_system.register_voters([voter_id for voter_id, _ in votes_to_cast])
+        self.assertFalse(register_result["failures"], "Registration should succeed for every voter")
+        vote_result = voting_system.cast_votes(votes_to_cast)
+        self.assertFalse(vote_result["failures"], "Vote casting should succeed for every voter")
         
         # Create blocks from pending votes if any votes were cast
         if len(votes_to_cast) > 0:
@@ -867,19 +861,15 @@ class TestPropertyExamples(unittest.TestCase):
                              "total_votes should be an integer")
         
         # Test 7: Verify vote counts match expected values
-        expected_counts = {}
-        for voter_id, candidate in votes_to_cast:
-            expected_counts[candidate] = expected_counts.get(candidate, 0) + 1
+        expected_counts = Counter(candidate for _, candidate in votes_to_cast)
         
         actual_counts = results["vote_counts"]
         expected_total = sum(expected_counts.values())
         
         self.assertEqual(results["total_votes"], expected_total,
                         f"Total votes should be {expected_total}")
-        
-        for candidate, expected_count in expected_counts.items():
-            self.assertEqual(actual_counts.get(candidate, 0), expected_count,
-                           f"Vote count for {candidate} should be {expected_count}")
+        self.assertEqual(Counter(actual_counts), expected_counts,
+                         "Vote counts per candidate should match expected counts")
         
         # Test 8: Additional status fields should be present
         self.assertIn("registered_voters", results,
@@ -921,9 +911,6 @@ class TestPropertyExamples(unittest.TestCase):
         
         # Test 10: Test with corrupted blockchain to verify validation status changes
         if len(votes_to_cast) > 0:  # Only test corruption if we have blocks to corrupt
-            # Make a backup of the original system
-            original_system_dict = voting_system.to_dict()
-            
             # Corrupt the blockchain by modifying a block hash
             if voting_system.blockchain.get_block_count() > 1:  # Don't corrupt genesis block
                 corrupted_block = voting_system.blockchain.chain[1]
@@ -945,8 +932,8 @@ class TestPropertyExamples(unittest.TestCase):
                 self.assertIn("total_votes", corrupted_results,
                              "total_votes should still be present in corrupted results")
                 
-                # Restore the original system
-                voting_system = VotingSystem.from_dict(original_system_dict)
+                # Restore the original hash
+                corrupted_block.hash = original_hash
                 
                 # Verify restoration worked
                 restored_results = voting_system.get_results()
@@ -967,20 +954,20 @@ class TestPropertyExamples(unittest.TestCase):
         self.assertEqual(len(empty_results["validation_issues"]), 0,
                         "Empty system should have no validation issues")
     
+    @SLOW_PROPERTY
     @given(
         votes_to_cast=st.lists(
             st.tuples(
-                st.text(min_size=1, max_size=20, alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd'))),
-                st.text(min_size=1, max_size=20, alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd')))
+                short_text(1, 20),
+                short_text(1, 20)
             ),
             min_size=0,
             max_size=10,
             unique_by=lambda x: x[0]  # Ensure unique voter IDs
         ),
-        num_blocks=st.integers(min_value=0, max_value=3),
-        filename=st.text(min_size=5, max_size=30, alphabet='abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_').map(lambda x: f"test_{x}.json")
+        num_blocks=st.integers(min_value=0, max_value=3)
     )
-    def test_data_persistence_round_trip_property_10(self, votes_to_cast, num_blocks, filename):
+    def test_data_persistence_round_trip_property_10(self, votes_to_cast, num_blocks):
         """
         Property 10: Data Persistence Round Trip
         Feature: blockchain-voting, Property 10: Data Persistence Round Trip
@@ -989,31 +976,22 @@ class TestPropertyExamples(unittest.TestCase):
         For any system state, saving then loading should restore the exact same voter 
         registrations, blockchain data, and validation status.
         """
-        import tempfile
-        import os
-        
-        # Create a fresh voting system
-        original_system = VotingSystem()
+        # Reset the shared voting system
+        original_system = self.voting_system
+        original_system.reset()
         
         # Build up system state with voters and votes
         all_voters = []
-        expected_vote_counts = {}
+        expected_vote_counts = Counter()
         
         # Register voters and cast votes
-        for voter_id, candidate in votes_to_cast:
-            # Register voter
-            register_result = original_system.register_voter(voter_id)
-            self.assertTrue(register_result["success"], 
-                           f"Registration should succeed for voter {voter_id}")
-            all_voters.append(voter_id)
-            
-            # Cast vote
-            vote_result = original_system.cast_vote(voter_id, candidate)
-            self.assertTrue(vote_result["success"], 
-                           f"Vote casting should succeed for voter {voter_id}")
-            
-            # Track expected vote counts
-            expected_vote_counts[candidate] = expected_vote_counts.get(candidate, 0) + 1
+        register_result = original_system.register_voters([voter_id for voter_id, _ in votes_to_cast])
+        self.assertFalse(register_result["failures"], "Registration should succeed for every voter")
+        vote_result = original_system.cast_votes(votes_to_cast)
+        self.assertFalse(vote_result["failures"], "Vote casting should succeed for every voter")
+        
+        all_voters.extend(voter_id for voter_id, _ in votes_to_cast)
+        expected_vote_counts.update(candidate for _, candidate in votes_to_cast)
         
         # Create blocks from votes (split across multiple blocks if specified)
         if len(votes_to_cast) > 0 and num_blocks > 0:
@@ -1042,187 +1020,223 @@ class TestPropertyExamples(unittest.TestCase):
         original_results = original_system.get_results()
         original_validation = original_system.validate_system_integrity()
         
-        # Test 1: Save system state to temporary file
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_filename = os.path.join(temp_dir, filename)
-            
-            save_result = original_system.save_state(temp_filename)
-            self.assertTrue(save_result["success"], 
-                           f"Saving system state should succeed: {save_result.get('message', '')}")
-            self.assertEqual(save_result["filename"], temp_filename,
-                           "Save result should contain correct filename")
-            
-            # Test 2: Verify file was created and contains data
-            self.assertTrue(os.path.exists(temp_filename),
-                           "Save file should exist after saving")
-            
-            file_size = os.path.getsize(temp_filename)
-            self.assertGreater(file_size, 0, "Save file should not be empty")
-            
-            # Test 3: Create new system and load state
-            loaded_system = VotingSystem()
-            
-            # Verify new system starts empty
-            self.assertEqual(len(loaded_system.get_registered_voters()), 0,
-                           "New system should start with no registered voters")
-            self.assertEqual(loaded_system.blockchain.get_block_count(), 1,
-                           "New system should start with only genesis block")
-            
-            load_result = loaded_system.load_state(temp_filename)
-            self.assertTrue(load_result["success"], 
-                           f"Loading system state should succeed: {load_result.get('message', '')}")
-            self.assertEqual(load_result["filename"], temp_filename,
-                           "Load result should contain correct filename")
-            
-            # Test 4: Verify voter registrations are preserved
-            loaded_registered_voters = set(loaded_system.get_registered_voters())
-            loaded_voted_voters = set(loaded_system.get_voted_voters())
-            
-            self.assertEqual(loaded_registered_voters, original_registered_voters,
-                           "Loaded system should have same registered voters as original")
-            self.assertEqual(loaded_voted_voters, original_voted_voters,
-                           "Loaded system should have same voted voters as original")
-            self.assertEqual(len(loaded_registered_voters), len(all_voters),
-                           f"Should have {len(all_voters)} registered voters after loading")
-            
-            # Test 5: Verify blockchain data is preserved
-            loaded_blockchain_votes = loaded_system.blockchain.get_all_votes()
-            loaded_block_count = loaded_system.blockchain.get_block_count()
-            
-            self.assertEqual(loaded_block_count, original_block_count,
-                           "Loaded system should have same number of blocks as original")
-            self.assertEqual(len(loaded_blockchain_votes), len(original_blockchain_votes),
-                           "Loaded system should have same number of blockchain votes as original")
-            
-            # Verify individual votes match
-            original_vote_data = [(v.voter_id, v.candidate, v.timestamp) for v in original_blockchain_votes]
-            loaded_vote_data = [(v.voter_id, v.candidate, v.timestamp) for v in loaded_blockchain_votes]
-            
-            self.assertEqual(set(loaded_vote_data), set(original_vote_data),
-                           "Loaded blockchain votes should match original votes exactly")
-            
-            # Test 6: Verify pending votes are preserved
-            loaded_pending_votes = loaded_system.get_pending_votes()
-            self.assertEqual(len(loaded_pending_votes), len(original_pending_votes),
-                           "Loaded system should have same number of pending votes as original")
-            
-            if len(original_pending_votes) > 0:
-                original_pending_data = [(v.voter_id, v.candidate, v.timestamp) for v in original_pending_votes]
-                loaded_pending_data = [(v.voter_id, v.candidate, v.timestamp) for v in loaded_pending_votes]
-                
-                self.assertEqual(set(loaded_pending_data), set(original_pending_data),
-                               "Loaded pending votes should match original pending votes exactly")
-            
-            # Test 7: Verify vote counting results are preserved
-            loaded_results = loaded_system.get_results()
-            self.assertTrue(loaded_results["success"], "Getting results from loaded system should succeed")
-            
-            self.assertEqual(loaded_results["vote_counts"], original_results["vote_counts"],
-                           "Loaded system vote counts should match original")
-            self.assertEqual(loaded_results["total_votes"], original_results["total_votes"],
-                           "Loaded system total votes should match original")
-            self.assertEqual(loaded_results["registered_voters"], original_results["registered_voters"],
-                           "Loaded system registered voters count should match original")
-            self.assertEqual(loaded_results["voted_voters"], original_results["voted_voters"],
-                           "Loaded system voted voters count should match original")
-            self.assertEqual(loaded_results["pending_votes"], original_results["pending_votes"],
-                           "Loaded system pending votes count should match original")
-            self.assertEqual(loaded_results["total_blocks"], original_results["total_blocks"],
-                           "Loaded system total blocks should match original")
-            
-            # Test 8: Verify validation status is preserved
-            loaded_validation = loaded_system.validate_system_integrity()
-            self.assertTrue(loaded_validation["success"], "Loaded system validation should succeed")
-            
-            self.assertEqual(loaded_validation["blockchain_valid"], original_validation["blockchain_valid"],
-                           "Loaded system blockchain validation should match original")
-            self.assertEqual(loaded_validation["integrity_valid"], original_validation["integrity_valid"],
-                           "Loaded system integrity validation should match original")
-            self.assertEqual(loaded_validation["issues"], original_validation["issues"],
-                           "Loaded system validation issues should match original")
-            
-            # Test 9: Verify loaded system can continue operating normally
-            if len(votes_to_cast) > 0:
-                # Try to register a new voter in loaded system
-                new_voter_id = f"new_voter_{len(all_voters)}"
-                new_candidate = f"new_candidate_{len(expected_vote_counts)}"
-                
-                new_register_result = loaded_system.register_voter(new_voter_id)
-                self.assertTrue(new_register_result["success"], 
-                               "Should be able to register new voter in loaded system")
-                
-                new_vote_result = loaded_system.cast_vote(new_voter_id, new_candidate)
-                self.assertTrue(new_vote_result["success"], 
-                               "Should be able to cast vote in loaded system")
-                
-                # Verify the new vote is properly handled
-                self.assertEqual(loaded_system.get_pending_votes_count(), 
-                               len(original_pending_votes) + 1,
-                               "Loaded system should handle new votes correctly")
-                
-                # Create block from new pending votes
-                if loaded_system.get_pending_votes_count() > 0:
-                    new_block_result = loaded_system.create_block_from_pending_votes()
-                    self.assertTrue(new_block_result["success"], 
-                                   "Should be able to create blocks in loaded system")
-            
-            # Test 10: Test round-trip preservation with serialization
-            # Save the loaded system and verify it produces identical data
-            temp_filename_2 = os.path.join(temp_dir, f"roundtrip_{filename}")
-            
-            save_result_2 = loaded_system.save_state(temp_filename_2)
-            self.assertTrue(save_result_2["success"], "Second save should succeed")
-            
-            # Load into a third system
-            third_system = VotingSystem()
-            load_result_2 = third_system.load_state(temp_filename_2)
-            self.assertTrue(load_result_2["success"], "Second load should succeed")
-            
-            # Verify third system matches loaded system (which should match original)
-            third_results = third_system.get_results()
-            
-            # Compare key metrics (allowing for the new vote if it was added)
-            if len(votes_to_cast) == 0:
-                # If no original votes, systems should be identical
-                self.assertEqual(third_results["vote_counts"], loaded_results["vote_counts"],
-                               "Third system should match loaded system exactly")
-                self.assertEqual(third_results["total_votes"], loaded_results["total_votes"],
-                               "Third system total votes should match loaded system")
-            else:
-                # If we added a new vote, account for it
-                expected_total_after_new_vote = original_results["total_votes"]
-                if loaded_system.get_pending_votes_count() == 0:  # Block was created
-                    expected_total_after_new_vote += 1
-                
-                # The core original data should still be preserved
-                for candidate, count in original_results["vote_counts"].items():
-                    self.assertEqual(third_results["vote_counts"].get(candidate, 0), count,
-                                   f"Third system should preserve original vote count for {candidate}")
-            
-            # Test 11: Verify blockchain integrity is maintained through persistence
-            third_validation = third_system.validate_system_integrity()
-            self.assertTrue(third_validation["success"], "Third system validation should succeed")
-            self.assertTrue(third_validation["blockchain_valid"], "Third system blockchain should be valid")
-            self.assertTrue(third_validation["integrity_valid"], "Third system integrity should be valid")
-            
-            # Test 12: Test error handling for invalid files
-            invalid_filename = os.path.join(temp_dir, "nonexistent.json")
-            error_system = VotingSystem()
-            
-            load_error_result = error_system.load_state(invalid_filename)
-            self.assertFalse(load_error_result["success"], "Loading nonexistent file should fail")
-            self.assertEqual(load_error_result["error"], "FILE_NOT_FOUND",
-                           "Should return FILE_NOT_FOUND error for nonexistent file")
-            
-            # Test 13: Test with corrupted JSON file
-            corrupted_filename = os.path.join(temp_dir, "corrupted.json")
-            with open(corrupted_filename, 'w') as f:
-                f.write("invalid json content {")
+        # Test 1: Save system state to an in-memory stream
+        buffer = io.BytesIO()
+        
+        save_result = original_system.save_state_to_stream(buffer)
+        self.assertTrue(save_result["success"], 
+                       f"Saving system state should succeed: {save_result.get('message', '')}")
+        
+        # Test 2: Verify the stream contains data
+        self.assertGreater(len(buffer.getvalue()), 0, "Saved state should not be empty")
+        buffer.seek(0)
+        
+        # Test 3: Create new system and load state
+        loaded_system = VotingSystem()
+        
+        # Verify new system starts empty
+        self.assertEqual(len(loaded_system.get_registered_voters()), 0,
+                       "New system should start with no registered voters")
+        self.assertEqual(loaded_system.blockchain.get_block_count(), 1,
+                       "New system should start with only genesis block")
+        
+        load_result = loaded_system.load_state_from_stream(buffer)
+        self.assertTrue(load_result["success"], 
+                       f"Loading system state should succeed: {load_result.get('message', '')}")
+        
+        # Test 4: Verify voter registrations are preserved
+        loaded_registered_voters = set(loaded_system.get_registered_voters())
+        loaded_voted_voters = set(loaded_system.get_voted_voters())
+        
+        self.assertEqual(loaded_registered_voters, original_registered_voters,
+                       "Loaded system should have same registered voters as original")
+        self.assertEqual(loaded_voted_voters, original_voted_voters,
+                       "Loaded system should have same voted voters as original")
+        self.assertEqual(len(loaded_registered_voters), len(all_voters),
+                       f"Should have {len(all_voters)} registered voters after loading")
+        
+        # Test 5: Verify blockchain data is preserved
+        loaded_blockchain_votes = loaded_system.blockchain.get_all_votes()
+        loaded_block_count = loaded_system.blockchain.get_block_count()
+        
+        self.assertEqual(loaded_block_count, original_block_count,
+                       "Loaded system should have same number of blocks as original")
+        self.assertEqual(len(loaded_blockchain_votes), len(original_blockchain_votes),
+                       "Loaded system should have same number of blockchain votes as original")
+        
+        # Verify individual votes match
+        original_vote_data = set(map(VOTE_FIELDS, original_blockchain_votes))
+        loaded_vote_data = set(map(VOTE_FIELDS, loaded_blockchain_votes))
+        
+        self.assertEqual(loaded_vote_data, original_vote_data,
+                       "Loaded blockchain votes should match original votes exactly")
+        
+        # Test 6: Verify pending votes are preserved
+        loaded_pending_votes = loaded_system.get_pending_votes()
+        self.assertEqual(len(loaded_pending_votes), len(original_pending_votes),
+                       "Loaded system should have same number of pending votes as original")
+        
+        if len(original_pending_votes) > 0:
+            original_pending_data = set(map(VOTE_FIELDS, original_pending_votes))
+            loaded_pending_data = set(map(VOTE_FIELDS, loaded_pending_votes))
             
-            corrupted_load_result = error_system.load_state(corrupted_filename)
-            self.assertFalse(corrupted_load_result["success"], "Loading corrupted file should fail")
-            self.assertEqual(corrupted_load_result["error"], "LOAD_ERROR",
-                           "Should return LOAD_ERROR for corrupted file")
+            # Only format the (potentially large) sets when they differ
+            if loaded_pending_data != original_pending_data:
+                self.fail(f"Loaded pending votes should match original pending votes exactly: "
+                          f"{loaded_pending_data ^ original_pending_data}")
+        
+        # Test 7: Verify vote counting results are preserved
+        loaded_results = loaded_system.get_results()
+        self.assertTrue(loaded_results["success"], "Getting results from loaded system should succeed")
+        
+        self.assertEqual(tuple(loaded_results[k] for k in RESULT_KEYS),
+                       tuple(original_results[k] for k in RESULT_KEYS),
+                       "Loaded system result fields should match original")
+        
+        # Test 8: Verify validation status is preserved
+        loaded_validation = loaded_system.validate_system_integrity()
+        self.assertTrue(loaded_validation["success"], "Loaded system validation should succeed")
+        
+        self.assertEqual(tuple(loaded_validation[k] for k in VALIDATION_KEYS),
+                       tuple(original_validation[k] for k in VALIDATION_KEYS),
+                       "Loaded system validation status should match original")
+        
+        # Test 9: Verify loaded system can continue operating normally
+        if len(votes_to_cast) > 0:
+            # Try to register a new voter in loaded system
+            new_voter_id = f"new_voter_{len(all_voters)}"
+            new_candidate = f"new_candidate_{len(expected_vote_counts)}"
+            
+            new_register_result = loaded_system.register_voter(new_voter_id)
+            self.assertTrue(new_register_result["success"], 
+                           "Should be able to register new voter in loaded system")
+            
+            new_vote_result = loaded_system.cast_vote(new_voter_id, new_candidate)
+            self.assertTrue(new_vote_result["success"], 
+                           "Should be able to cast vote in loaded system")
+            
+            # Verify the new vote is properly handled
+            self.assertEqual(loaded_system.get_pending_votes_count(), 
+                           len(original_pending_votes) + 1,
+                           "Loaded system should handle new votes correctly")
+            
+            # Create block from new pending votes
+            if loaded_system.get_pending_votes_count() > 0:
+                new_block_result = loaded_system.create_block_from_pending_votes()
+                self.assertTrue(new_block_result["success"], 
+                               "Should be able to create blocks in loaded system")
+        
+        # Test 10: Test round-trip preservation with serialization
+        # Save the loaded system in memory and verify it produces identical data
+        buffer_2 = io.BytesIO()
+        save_result_2 = loaded_system.save_state_to_stream(buffer_2)
+        self.assertTrue(save_result_2["success"], "Second save should succeed")
+        
+        # Load into a third system
+        third_system = VotingSystem()
+        load_result_2 = third_system.load_state_from_stream(io.BytesIO(buffer_2.getvalue()))
+        self.assertTrue(load_result_2["success"], "Second load should succeed")
+        
+        # Verify third system matches loaded system (which should match original)
+        third_results = third_system.get_results()
+        
+        # Compare key metrics (allowing for the new vote if it was added)
+        if len(votes_to_cast) == 0:
+            # If no original votes, systems should be identical
+            self.assertEqual(third_results["vote_counts"], loaded_results["vote_counts"],
+                           "Third system should match loaded system exactly")
+            self.assertEqual(third_results["total_votes"], loaded_results["total_votes"],
+                           "Third system total votes should match loaded system")
+        else:
+            # If we added a new vote, account for it
+            expected_total_after_new_vote = original_results["total_votes"]
+            if loaded_system.get_pending_votes_count() == 0:  # Block was created
+                expected_total_after_new_vote += 1
+            
+            # The core original data should still be preserved
+            for candidate, count in original_results["vote_counts"].items():
+                self.assertEqual(third_results["vote_counts"].get(candidate, 0), count,
+                               f"Third system should preserve original vote count for {candidate}")
+        
+        # Test 11: Verify blockchain integrity is maintained through persistence
+        third_validation = third_system.validate_system_integrity()
+        self.assertTrue(third_validation["success"], "Third system validation should succeed")
+        self.assertTrue(third_validation["blockchain_valid"], "Third system blockchain should be valid")
+        self.assertTrue(third_validation["integrity_valid"], "Third system integrity should be valid")
+        
+        # Test 12: Test error handling for invalid files
+        invalid_filename = os.path.join(tempfile.gettempdir(), f"nonexistent_{uuid.uuid4().hex}.json")
+        error_system = VotingSystem()
+        
+        load_error_result = error_system.load_state(invalid_filename)
+        self.assertFalse(load_error_result["success"], "Loading nonexistent file should fail")
+        self.assertEqual(load_error_result["error"], "FILE_NOT_FOUND",
+                       "Should return FILE_NOT_FOUND error for nonexistent file")
+        
+        # Test 13: Test with corrupted JSON (the parser is under test, not the filesystem)
+        corrupted_load_result = error_system.load_state_from_stream(io.BytesIO(b"invalid json content {"))
+        self.assertFalse(corrupted_load_result["success"], "Loading corrupted data should fail")
+        self.assertEqual(corrupted_load_result["error"], "LOAD_ERROR",
+                       "Should return LOAD_ERROR for corrupted data")
+
+
+class VotingMachine(RuleBasedStateMachine):
+    """
+    Stateful model of a voting session.
+    
+    Covers Properties 8-10 over generated operation sequences: one VotingSystem
+    lives across all steps and is checked against a shadow tally after each one.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.voting_system = VotingSystem()
+        self.voted = set()
+        self.pending = Counter()
+        self.mined = Counter()
+    
+    @rule(voter_id=short_text(1, 20), candidate=short_text(1, 20))
+    def register_and_vote(self, voter_id, candidate):
+        self.voting_system.register_voter(voter_id)
+        result = self.voting_system.cast_vote(voter_id, candidate)
+        
+        # A vote is accepted if and only if the voter has not voted before
+        assert result["success"] == (voter_id not in self.voted)
+        if result["success"]:
+            self.voted.add(voter_id)
+            self.pending[candidate] += 1
+    
+    @rule()
+    def seal_block(self):
+        result = self.voting_system.create_block_from_pending_votes()
+        
+        assert result["success"] == bool(self.pending)
+        self.mined += self.pending
+        self.pending = Counter()
+    
+    @rule()
+    def round_trip(self):
+        buffer = io.BytesIO()
+        assert self.voting_system.save_state_to_stream(buffer)["success"]
+        buffer.seek(0)
+        
+        loaded_system = VotingSystem()
+        assert loaded_system.load_state_from_stream(buffer)["success"]
+        self.voting_system = loaded_system
+    
+    @invariant()
+    def counts_match_expected(self):
+        results = self.voting_system.get_results()
+        
+        assert results["vote_counts"] == dict(self.mined)
+        assert results["total_votes"] == sum(self.mined.values())
+        assert results["pending_votes"] == sum(self.pending.values())
+        assert results["voted_voters"] == len(self.voted)
+        assert results["blockchain_valid"] and results["integrity_valid"]
+
+
+VotingMachine.TestCase.settings = settings(max_examples=25, stateful_step_count=20, deadline=None)
+TestVotingMachine = VotingMachine.TestCase
 
 
 if __name__ == '__main__':
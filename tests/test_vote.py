@@ -4,6 +4,7 @@ Unit tests for Vote class.
 
 import unittest
 import time
+from unittest import mock
 from blockchain_voting.voting.vote import Vote
 
 
@@ -24,6 +25,14 @@ class TestVote(unittest.TestCase):
         self.assertEqual(vote.candidate, self.valid_candidate)
         self.assertEqual(vote.timestamp, self.valid_timestamp)
     
+    def test_vote_uses_slots(self):
+        """Test votes store their fields in slots rather than a per-instance dict."""
+        vote = Vote(self.valid_voter_id, self.valid_candidate, self.valid_timestamp)
+        
+        self.assertFalse(hasattr(vote, "__dict__"))
+        with self.assertRaises(AttributeError):
+            vote.extra = "not allowed"
+    
     def test_vote_validation_empty_voter_id(self):
         """Test vote creation with empty voter_id raises ValueError."""
         with self.assertRaises(ValueError):
@@ -73,14 +82,13 @@ class TestVote(unittest.TestCase):
     
     def test_create_vote(self):
         """Test creating vote with current timestamp."""
-        before_time = time.time()
-        vote = Vote.create_vote(self.valid_voter_id, self.valid_candidate)
-        after_time = time.time()
+        with mock.patch.object(time, "time", return_value=1700000000.5) as clock:
+            vote = Vote.create_vote(self.valid_voter_id, self.valid_candidate)
         
         self.assertEqual(vote.voter_id, self.valid_voter_id)
         self.assertEqual(vote.candidate, self.valid_candidate)
-        self.assertGreaterEqual(vote.timestamp, before_time)
-        self.assertLessEqual(vote.timestamp, after_time)
+        self.assertEqual(vote.timestamp, 1700000000.5)
+        clock.assert_called_once_with()
 
 
 if __name__ == '__main__':
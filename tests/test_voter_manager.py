@@ -2,11 +2,26 @@
 Unit tests for VoterManager class.
 """
 
+import string
 import unittest
-from hypothesis import given, strategies as st
+from collections import Counter
+from hypothesis import given, settings, strategies as st
 from blockchain_voting.voting import VoterManager
 
 
+# VoterManager only checks that IDs are non-empty strings, so a fixed ASCII
+# alphabet covers it as well as sampling Unicode categories, and draws faster
+ID_ALPHABET = string.ascii_letters + string.digits + "_-"
+VOTER_ID = st.text(alphabet=ID_ALPHABET, min_size=1, max_size=50)
+
+# List strategies are built once at import time and shared by the properties
+ADDITIONAL_VOTER_IDS = st.lists(VOTER_ID, min_size=0, max_size=10)
+UNIQUE_VOTER_IDS = st.lists(VOTER_ID, min_size=0, max_size=20, unique=True)
+
+# Fixed example budget with no deadline, and no on-disk example database
+PROPERTY_SETTINGS = settings(deadline=None, max_examples=30, database=None)
+
+
 class TestVoterManager(unittest.TestCase):
     """Test cases for VoterManager functionality."""
     
@@ -27,6 +42,22 @@ class TestVoterManager(unittest.TestCase):
         self.assertFalse(result)
         self.assertEqual(self.voter_manager.get_registration_count(), 1)
     
+    def test_register_new_voters_batch(self):
+        """Test registering several voters at once."""
+        self.voter_manager.register_voter("voter2")
+        
+        result = self.voter_manager.register_new_voters(["voter1", "voter2", "voter3", "voter1"])
+        
+        self.assertEqual(result, ["voter1", "voter3"])
+        self.assertEqual(self.voter_manager.get_registered_voters(), ["voter1", "voter2", "voter3"])
+    
+    def test_register_new_voters_batch_invalid_id(self):
+        """Test an invalid ID in a batch registers nobody."""
+        with self.assertRaises(ValueError):
+            self.voter_manager.register_new_voters(["voter1", ""])
+        
+        self.assertEqual(self.voter_manager.get_registration_count(), 0)
+    
     def test_register_voter_invalid_id(self):
         """Test registration with invalid voter ID."""
         with self.assertRaises(ValueError):
@@ -67,6 +98,23 @@ class TestVoterManager(unittest.TestCase):
         self.assertEqual(set(registered), set(voters))
         self.assertEqual(len(registered), 3)
     
+    def test_get_registered_voter_set(self):
+        """Test the registered voter set is reused until the next registration."""
+        self.voter_manager.register_new_voters(["voter1", "voter2"])
+        
+        voter_set = self.voter_manager.get_registered_voter_set()
+        self.assertEqual(voter_set, frozenset({"voter1", "voter2"}))
+        self.assertIs(self.voter_manager.get_registered_voter_set(), voter_set)
+        
+        self.voter_manager.register_voter("voter1")  # Duplicate leaves the snapshot valid
+        self.assertIs(self.voter_manager.get_registered_voter_set(), voter_set)
+        
+        self.voter_manager.register_voter("voter3")
+        self.assertEqual(self.voter_manager.get_registered_voter_set(), frozenset({"voter1", "voter2", "voter3"}))
+        
+        self.voter_manager.clear()
+        self.assertEqual(self.voter_manager.get_registered_voter_set(), frozenset())
+    
     def test_get_voted_voters(self):
         """Test getting list of voters who have voted."""
         self.voter_manager.register_voter("voter1")
@@ -112,13 +160,28 @@ class TestVoterManager(unittest.TestCase):
                 "voted_voters": ["voter2"]  # voter2 not registered
             })
     
+    def _assert_registration_invariant(self, voter_manager, expected_count, expected_set, must_contain):
+        """
+        Assert a failed registration attempt left the registry unchanged.
+        
+        Args:
+            voter_manager: VoterManager under test
+            expected_count: Registration count before the attempt
+            expected_set: Registered voter set before the attempt
+            must_contain: Voter ID that must still be registered
+        """
+        if not voter_manager.is_registered(must_contain):
+            self.fail(f"Voter '{must_contain}' should still be registered")
+        if voter_manager.get_registration_count() != expected_count:
+            self.fail(f"Registration count should remain {expected_count}, "
+                      f"got {voter_manager.get_registration_count()}")
+        if voter_manager.get_registered_voter_set() != expected_set:
+            self.fail("Registered voters should remain unchanged")
+    
+    @PROPERTY_SETTINGS
     @given(
-        voter_id=st.text(min_size=1, max_size=50, alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd', 'Pc', 'Pd'))),
-        additional_voter_ids=st.lists(
-            st.text(min_size=1, max_size=50, alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd', 'Pc', 'Pd'))),
-            min_size=0,
-            max_size=10
-        )
+        voter_id=VOTER_ID,
+        additional_voter_ids=ADDITIONAL_VOTER_IDS
     )
     def test_voter_registration_uniqueness_property_1(self, voter_id, additional_voter_ids):
         """
@@ -130,7 +193,9 @@ class TestVoterManager(unittest.TestCase):
         registered before, and attempting to register a duplicate should leave the 
         system state unchanged.
         """
-        voter_manager = VoterManager()
+        # Reuse the fixture manager; clear() empties it in place
+        voter_manager = self.voter_manager
+        voter_manager.clear()
         
         # Test 1: First registration should succeed
         initial_count = voter_manager.get_registration_count()
@@ -143,56 +208,45 @@ class TestVoterManager(unittest.TestCase):
         
         # Test 2: Duplicate registration should fail and leave state unchanged
         pre_duplicate_count = voter_manager.get_registration_count()
-        pre_duplicate_voters = set(voter_manager.get_registered_voters())
+        pre_duplicate_voters = voter_manager.get_registered_voter_set()
         
-        duplicate_result = voter_manager.register_voter(voter_id)
-        
-        self.assertFalse(duplicate_result, "Duplicate registration should fail")
-        self.assertTrue(voter_manager.is_registered(voter_id), "Voter should still be registered after duplicate attempt")
-        self.assertEqual(voter_manager.get_registration_count(), pre_duplicate_count,
-                        "Registration count should remain unchanged after duplicate attempt")
-        self.assertEqual(set(voter_manager.get_registered_voters()), pre_duplicate_voters,
-                        "Registered voters list should remain unchanged after duplicate attempt")
+        self.assertFalse(voter_manager.register_voter(voter_id), "Duplicate registration should fail")
+        self._assert_registration_invariant(voter_manager, pre_duplicate_count, pre_duplicate_voters, voter_id)
         
         # Test 3: Multiple duplicate attempts should all fail
-        for _ in range(3):
-            pre_attempt_count = voter_manager.get_registration_count()
-            pre_attempt_voters = set(voter_manager.get_registered_voters())
-            
-            duplicate_result = voter_manager.register_voter(voter_id)
-            
-            self.assertFalse(duplicate_result, "Multiple duplicate registrations should all fail")
-            self.assertEqual(voter_manager.get_registration_count(), pre_attempt_count,
-                            "Registration count should remain unchanged after multiple duplicate attempts")
-            self.assertEqual(set(voter_manager.get_registered_voters()), pre_attempt_voters,
-                            "Registered voters list should remain unchanged after multiple duplicate attempts")
+        duplicate_results = [voter_manager.register_voter(voter_id) for _ in range(3)]
         
-        # Test 4: Other unique voter IDs should still register successfully
-        already_registered = {voter_id}  # Track what we've registered so far
+        self.assertEqual(duplicate_results, [False, False, False],
+                        "Multiple duplicate registrations should all fail")
+        self._assert_registration_invariant(voter_manager, pre_duplicate_count, pre_duplicate_voters, voter_id)
         
+        # Test 4: Other unique voter IDs should still register successfully
+        # Split the additional IDs up front into first occurrences and repeats
+        seen = {voter_id}
+        unique_new = []
+        duplicates = []
         for other_voter_id in additional_voter_ids:
-            if other_voter_id not in already_registered:  # Only test truly unique voter IDs
-                pre_other_count = voter_manager.get_registration_count()
-                other_result = voter_manager.register_voter(other_voter_id)
-                
-                self.assertTrue(other_result, f"Registration of unique voter ID '{other_voter_id}' should succeed")
-                self.assertTrue(voter_manager.is_registered(other_voter_id), 
-                              f"Voter '{other_voter_id}' should be registered after successful registration")
-                self.assertEqual(voter_manager.get_registration_count(), pre_other_count + 1,
-                               f"Registration count should increase after registering '{other_voter_id}'")
-                already_registered.add(other_voter_id)
-            else:
-                # This voter ID was already registered (duplicate in our test)
-                pre_other_count = voter_manager.get_registration_count()
-                other_result = voter_manager.register_voter(other_voter_id)
-                
-                self.assertFalse(other_result, f"Duplicate registration of '{other_voter_id}' should fail")
-                self.assertEqual(voter_manager.get_registration_count(), pre_other_count,
-                               f"Registration count should remain unchanged for duplicate '{other_voter_id}'")
-        
-        # Test 5: Original voter should still be registered and unchanged
-        self.assertTrue(voter_manager.is_registered(voter_id), 
-                       "Original voter should still be registered after other registrations")
+            (duplicates if other_voter_id in seen else unique_new).append(other_voter_id)
+            seen.add(other_voter_id)
+        
+        for other_voter_id in unique_new:
+            # Messages are only formatted on failure
+            if not voter_manager.register_voter(other_voter_id):
+                self.fail(f"Registration of unique voter ID '{other_voter_id}' should succeed")
+            if not voter_manager.is_registered(other_voter_id):
+                self.fail(f"Voter '{other_voter_id}' should be registered after successful registration")
+        
+        self.assertEqual(voter_manager.get_registration_count(), 1 + len(unique_new),
+                        "Registration count should increase by one per unique voter ID")
+        post_unique_voters = voter_manager.get_registered_voter_set()
+        
+        # Repeated IDs (including the original voter ID) are all already registered
+        for other_voter_id in duplicates:
+            if voter_manager.register_voter(other_voter_id):
+                self.fail(f"Duplicate registration of '{other_voter_id}' should fail")
+        
+        # Test 5: Original voter should still be registered and the registry unchanged
+        self._assert_registration_invariant(voter_manager, 1 + len(unique_new), post_unique_voters, voter_id)
         
         # Test 6: System state should be consistent
         registered_voters = voter_manager.get_registered_voters()
@@ -200,20 +254,16 @@ class TestVoterManager(unittest.TestCase):
         
         # Each voter in the list should be registered
         for registered_voter in registered_voters:
-            self.assertTrue(voter_manager.is_registered(registered_voter),
-                           f"Every voter in registered list should be registered: {registered_voter}")
+            if not voter_manager.is_registered(registered_voter):
+                self.fail(f"Every voter in registered list should be registered: {registered_voter}")
         
         # No duplicates in registered voters list
         self.assertEqual(len(registered_voters), len(set(registered_voters)),
                         "Registered voters list should contain no duplicates")
     
+    @PROPERTY_SETTINGS
     @given(
-        voter_ids=st.lists(
-            st.text(min_size=1, max_size=50, alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd', 'Pc', 'Pd'))),
-            min_size=0,
-            max_size=20,
-            unique=True  # Ensure all voter IDs are unique
-        )
+        voter_ids=UNIQUE_VOTER_IDS
     )
     def test_voter_registry_completeness_property_2(self, voter_ids):
         """
@@ -224,14 +274,12 @@ class TestVoterManager(unittest.TestCase):
         For any set of registered voter IDs, retrieving the registered voters should 
         return exactly the same set with no additions or omissions.
         """
-        voter_manager = VoterManager()
+        # Reuse the fixture manager; clear() empties it in place
+        voter_manager = self.voter_manager
+        voter_manager.clear()
         
-        # Register all the voter IDs
-        successfully_registered = set()
-        for voter_id in voter_ids:
-            result = voter_manager.register_voter(voter_id)
-            if result:  # Should always be True since voter_ids are unique
-                successfully_registered.add(voter_id)
+        # Register all the voter IDs (all should be new since voter_ids are unique)
+        successfully_registered = set(voter_manager.register_new_voters(voter_ids))
         
         # All registrations should succeed since voter_ids are unique
         self.assertEqual(len(successfully_registered), len(voter_ids),
@@ -239,35 +287,18 @@ class TestVoterManager(unittest.TestCase):
         self.assertEqual(successfully_registered, set(voter_ids),
                         "Successfully registered set should match input set")
         
-        # Test 1: Retrieved voters should exactly match registered voters
+        # Tests 1-4: Retrieved voters should match registered voters exactly, with
+        # no additions, omissions or duplicates (a multiset comparison covers all four)
         retrieved_voters = voter_manager.get_registered_voters()
-        retrieved_set = set(retrieved_voters)
+        retrieved_counts = Counter(retrieved_voters)
         
-        self.assertEqual(retrieved_set, successfully_registered,
-                        "Retrieved voter set should exactly match registered voter set")
-        self.assertEqual(len(retrieved_voters), len(successfully_registered),
-                        "Retrieved voter count should match registered voter count")
-        
-        # Test 2: No additions - every retrieved voter should be one we registered
-        for retrieved_voter in retrieved_voters:
-            self.assertIn(retrieved_voter, successfully_registered,
-                         f"Retrieved voter '{retrieved_voter}' should be one we registered")
-        
-        # Test 3: No omissions - every registered voter should be retrieved
-        for registered_voter in successfully_registered:
-            self.assertIn(registered_voter, retrieved_set,
-                         f"Registered voter '{registered_voter}' should be in retrieved set")
-        
-        # Test 4: No duplicates in retrieved list
-        self.assertEqual(len(retrieved_voters), len(set(retrieved_voters)),
-                        "Retrieved voters list should contain no duplicates")
+        self.assertEqual(retrieved_counts, Counter(successfully_registered),
+                        "Retrieved voters should match registered voters exactly, without duplicates")
         
         # Test 5: Consistency check - is_registered should match retrieved list
         for voter_id in voter_ids:
-            is_registered_result = voter_manager.is_registered(voter_id)
-            in_retrieved_list = voter_id in retrieved_set
-            self.assertEqual(is_registered_result, in_retrieved_list,
-                           f"is_registered({voter_id}) should match presence in retrieved list")
+            if voter_manager.is_registered(voter_id) != (voter_id in retrieved_counts):
+                self.fail(f"is_registered({voter_id}) should match presence in retrieved list")
         
         # Test 6: Registration count should match retrieved count
         registration_count = voter_manager.get_registration_count()
@@ -290,13 +321,8 @@ class TestVoterManager(unittest.TestCase):
             new_manager = VoterManager.from_dict(data)
             
             # Check completeness is preserved
-            new_retrieved_voters = new_manager.get_registered_voters()
-            new_retrieved_set = set(new_retrieved_voters)
-            
-            self.assertEqual(new_retrieved_set, retrieved_set,
+            self.assertEqual(Counter(new_manager.get_registered_voters()), retrieved_counts,
                            "Voter registry completeness should be preserved through serialization")
-            self.assertEqual(len(new_retrieved_voters), len(retrieved_voters),
-                           "Voter count should be preserved through serialization")
 
 
 if __name__ == '__main__':
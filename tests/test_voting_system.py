@@ -2,19 +2,68 @@
 Unit tests for VotingSystem class.
 """
 
+import io
+import time
 import unittest
 import tempfile
 import os
+import uuid
+from unittest import mock
+from blockchain_voting import _json
 from blockchain_voting.voting.voting_system import VotingSystem
 
 
+# Keep file round trips in RAM on systems with a tmpfs mount; elsewhere fall
+# back to the default temporary directory
+TEMP_DIR = '/dev/shm' if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK) else tempfile.gettempdir()
+
+
+# Votes mined into the shared snapshot used by read-only tests
+MINED_VOTES = {"voter1": "candidate_a", "voter2": "candidate_a", "voter3": "candidate_b"}
+
+
+# Run the persistence round trips under the stdlib codec and, when it is
+# installed, under orjson
+CODECS = [("json", None)] + ([("orjson", _json.orjson)] if _json.orjson is not None else [])
+
+
 class TestVotingSystem(unittest.TestCase):
     """Test cases for VotingSystem class."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Mine MINED_VOTES once and keep the resulting state as a dict."""
+        voting_system = VotingSystem()
+        voting_system.register_voters(list(MINED_VOTES))
+        voting_system.cast_votes(list(MINED_VOTES.items()))
+        voting_system.create_block_from_pending_votes()
+        cls._mined_snapshot = voting_system.to_dict()
+    
     def setUp(self):
         """Set up test fixtures."""
         self.voting_system = VotingSystem()
     
+    def _load_mined(self):
+        """
+        Replace the fixture with a copy of the mined snapshot.
+        
+        from_dict rebuilds every block, vote and voter set, so the shared
+        snapshot is never aliased by the test's system.
+        """
+        self.voting_system = VotingSystem.from_dict(self._mined_snapshot)
+    
+    def _seed(self, votes):
+        """
+        Register voters, cast their votes and mine them into one block.
+        
+        Args:
+            votes: Mapping of voter_id to candidate
+        """
+        voting_system = self.voting_system
+        self.assertFalse(voting_system.register_voters(list(votes))["failures"])
+        self.assertFalse(voting_system.cast_votes(list(votes.items()))["failures"])
+        self.assertTrue(voting_system.create_block_from_pending_votes()["success"])
+    
     def test_voting_system_initialization(self):
         """Test VotingSystem initializes correctly."""
         self.assertIsNotNone(self.voting_system.blockchain)
@@ -22,6 +71,22 @@ class TestVotingSystem(unittest.TestCase):
         self.assertEqual(len(self.voting_system.pending_votes), 0)
         self.assertEqual(self.voting_system.blockchain.get_block_count(), 1)  # Genesis block
     
+    def test_reset(self):
+        """Test reset returns the system to its initial state."""
+        self.voting_system.register_voter("voter1")
+        self.voting_system.register_voter("voter2")
+        self.voting_system.cast_vote("voter1", "candidate_a")
+        self.voting_system.create_block_from_pending_votes()
+        self.voting_system.cast_vote("voter2", "candidate_b")
+        
+        self.voting_system.reset()
+        
+        self.assertEqual(self.voting_system.get_registered_voters(), [])
+        self.assertEqual(self.voting_system.get_voted_voters(), [])
+        self.assertEqual(self.voting_system.get_pending_votes_count(), 0)
+        self.assertEqual(self.voting_system.blockchain.get_block_count(), 1)  # Genesis block
+        self.assertTrue(self.voting_system.register_voter("voter1")["success"])
+    
     def test_register_voter_success(self):
         """Test successful voter registration."""
         result = self.voting_system.register_voter("voter1")
@@ -86,6 +151,34 @@ class TestVotingSystem(unittest.TestCase):
         self.assertEqual(result["error"], "ALREADY_VOTED")
         self.assertIn("already voted", result["message"])
     
+    def test_register_voters_batch(self):
+        """Test registering several voters in one call."""
+        self.voting_system.register_voter("voter2")
+        
+        result = self.voting_system.register_voters(["voter1", "voter2", "", "voter3"])
+        
+        self.assertFalse(result["success"])
+        self.assertEqual(result["registered"], ["voter1", "voter3"])
+        self.assertEqual([f["voter_id"] for f in result["failures"]], ["voter2", ""])
+        self.assertEqual([f["error"] for f in result["failures"]], ["DUPLICATE_VOTER", "INVALID_VOTER_ID"])
+        self.assertEqual(self.voting_system.get_registered_voters(), ["voter1", "voter2", "voter3"])
+    
+    def test_cast_votes_batch(self):
+        """Test casting several votes in one call."""
+        self.voting_system.register_voters(["voter1", "voter2"])
+        
+        result = self.voting_system.cast_votes([
+            ("voter1", "candidate_a"),
+            ("voter2", "candidate_b"),
+            ("voter1", "candidate_b"),
+            ("unregistered", "candidate_a")
+        ])
+        
+        self.assertFalse(result["success"])
+        self.assertEqual(result["cast"], ["voter1", "voter2"])
+        self.assertEqual([f["error"] for f in result["failures"]], ["ALREADY_VOTED", "UNREGISTERED_VOTER"])
+        self.assertEqual(self.voting_system.get_pending_votes_count(), 2)
+    
     def test_create_block_from_pending_votes_success(self):
         """Test successful block creation from pending votes."""
         # Register voters and cast votes
@@ -125,16 +218,8 @@ class TestVotingSystem(unittest.TestCase):
     
     def test_get_results_with_votes(self):
         """Test getting results with votes cast and mined."""
-        # Register voters and cast votes
-        self.voting_system.register_voter("voter1")
-        self.voting_system.register_voter("voter2")
-        self.voting_system.register_voter("voter3")
-        self.voting_system.cast_vote("voter1", "candidate_a")
-        self.voting_system.cast_vote("voter2", "candidate_a")
-        self.voting_system.cast_vote("voter3", "candidate_b")
-        
-        # Create block to mine votes
-        self.voting_system.create_block_from_pending_votes()
+        # Voters 1-3 voted a, a, b and the votes are mined
+        self._load_mined()
         
         # Get results
         result = self.voting_system.get_results()
@@ -148,6 +233,18 @@ class TestVotingSystem(unittest.TestCase):
         self.assertTrue(result["blockchain_valid"])
         self.assertTrue(result["integrity_valid"])
     
+    def test_direct_chain_tampering_detected(self):
+        """Test editing a mined vote in place is reported by later queries."""
+        self._seed({"voter1": "candidate_a"})
+        self.assertTrue(self.voting_system.validate_system_integrity()["blockchain_valid"])
+        
+        self.voting_system.blockchain.chain[1].votes[0].candidate = "candidate_b"
+        
+        self.assertFalse(self.voting_system.validate_system_integrity()["blockchain_valid"])
+        result = self.voting_system.get_results()
+        self.assertFalse(result["blockchain_valid"])
+        self.assertEqual(result["vote_counts"], {"candidate_b": 1})
+    
     def test_validate_system_integrity(self):
         """Test system integrity validation."""
         # Register voter and cast vote
@@ -167,14 +264,8 @@ class TestVotingSystem(unittest.TestCase):
     
     def test_get_candidate_votes(self):
         """Test getting votes for specific candidate."""
-        # Register voters and cast votes
-        self.voting_system.register_voter("voter1")
-        self.voting_system.register_voter("voter2")
-        self.voting_system.cast_vote("voter1", "candidate_a")
-        self.voting_system.cast_vote("voter2", "candidate_a")
-        
-        # Create block to mine votes
-        self.voting_system.create_block_from_pending_votes()
+        # Voters 1-3 voted a, a, b and the votes are mined
+        self._load_mined()
         
         result = self.voting_system.get_candidate_votes("candidate_a")
         
@@ -185,14 +276,8 @@ class TestVotingSystem(unittest.TestCase):
     
     def test_get_all_candidates(self):
         """Test getting all candidates."""
-        # Register voters and cast votes
-        self.voting_system.register_voter("voter1")
-        self.voting_system.register_voter("voter2")
-        self.voting_system.cast_vote("voter1", "candidate_b")
-        self.voting_system.cast_vote("voter2", "candidate_a")
-        
-        # Create block to mine votes
-        self.voting_system.create_block_from_pending_votes()
+        # Voters 1-3 voted a, a, b and the votes are mined
+        self._load_mined()
         
         candidates = self.voting_system.get_all_candidates()
         
@@ -200,12 +285,8 @@ class TestVotingSystem(unittest.TestCase):
     
     def test_get_vote_by_voter(self):
         """Test getting vote by specific voter."""
-        # Register voter and cast vote
-        self.voting_system.register_voter("voter1")
-        self.voting_system.cast_vote("voter1", "candidate_a")
-        
-        # Create block to mine vote
-        self.voting_system.create_block_from_pending_votes()
+        # Voters 1-3 voted a, a, b and the votes are mined
+        self._load_mined()
         
         result = self.voting_system.get_vote_by_voter("voter1")
         
@@ -236,37 +317,114 @@ class TestVotingSystem(unittest.TestCase):
     
     def test_save_and_load_state(self):
         """Test saving and loading system state."""
-        # Set up some state
+        # Set up some state: voters 1-3 voted a, a, b and the votes are mined
+        self._load_mined()
+        
+        # Save state to a unique path; save_state creates the file itself
+        temp_filename = os.path.join(TEMP_DIR, f"vs_{uuid.uuid4().hex}.json")
+        self.addCleanup(lambda: os.path.exists(temp_filename) and os.unlink(temp_filename))
+        
+        save_result = self.voting_system.save_state(temp_filename)
+        self.assertTrue(save_result["success"])
+        
+        # Create new voting system and load state
+        new_voting_system = VotingSystem()
+        load_result = new_voting_system.load_state(temp_filename)
+        
+        self.assertTrue(load_result["success"])
+        
+        # Verify state was loaded correctly
+        self.assertEqual(len(new_voting_system.get_registered_voters()), 3)
+        self.assertEqual(len(new_voting_system.get_voted_voters()), 3)
+        self.assertEqual(new_voting_system.blockchain.get_block_count(), 2)  # Genesis + 1 block
+        
+        results = new_voting_system.get_results()
+        self.assertEqual(results["vote_counts"], {"candidate_a": 2, "candidate_b": 1})
+    
+    def test_save_and_load_state_stream(self):
+        """Test saving and loading system state through an in-memory stream."""
         self.voting_system.register_voter("voter1")
+        self.voting_system.register_voter("voter2")
         self.voting_system.cast_vote("voter1", "candidate_a")
         self.voting_system.create_block_from_pending_votes()
+        self.voting_system.cast_vote("voter2", "candidate_b")
         
-        # Save state
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
-            temp_filename = f.name
-        
-        try:
-            save_result = self.voting_system.save_state(temp_filename)
-            self.assertTrue(save_result["success"])
-            
-            # Create new voting system and load state
+        buffer = io.BytesIO()
+        save_result = self.voting_system.save_state_to_stream(buffer)
+        self.assertTrue(save_result["success"])
+        
+        buffer.seek(0)
+        new_voting_system = VotingSystem()
+        load_result = new_voting_system.load_state_from_stream(buffer)
+        
+        self.assertTrue(load_result["success"])
+        self.assertTrue(load_result["validation"]["blockchain_valid"])
+        self.assertEqual(new_voting_system.get_registered_voters(), ["voter1", "voter2"])
+        self.assertEqual(new_voting_system.get_pending_votes_count(), 1)
+        self.assertEqual(new_voting_system.blockchain.get_block_count(), 2)
+        # Voter lists in to_dict() follow set order, so compare them sorted
+        self.assertEqual(new_voting_system.blockchain.to_dict(), self.voting_system.blockchain.to_dict())
+        self.assertEqual(new_voting_system.get_voted_voters(), self.voting_system.get_voted_voters())
+        self.assertEqual(new_voting_system.to_dict()["pending_votes"], self.voting_system.to_dict()["pending_votes"])
+    
+    def test_save_and_load_state_stdlib_json(self):
+        """Test state round trip when orjson is unavailable."""
+        self._seed({"voter1": "candidate_a"})
+        
+        with mock.patch.object(_json, "orjson", None):
+            buffer = io.BytesIO()
+            self.assertTrue(self.voting_system.save_state_to_stream(buffer)["success"])
+            buffer.seek(0)
             new_voting_system = VotingSystem()
-            load_result = new_voting_system.load_state(temp_filename)
-            
-            self.assertTrue(load_result["success"])
-            
-            # Verify state was loaded correctly
-            self.assertEqual(len(new_voting_system.get_registered_voters()), 1)
-            self.assertEqual(len(new_voting_system.get_voted_voters()), 1)
-            self.assertEqual(new_voting_system.blockchain.get_block_count(), 2)  # Genesis + 1 block
-            
-            results = new_voting_system.get_results()
-            self.assertEqual(results["vote_counts"]["candidate_a"], 1)
-            
-        finally:
-            # Clean up temp file
-            if os.path.exists(temp_filename):
-                os.unlink(temp_filename)
+            load_result = new_voting_system.load_state_from_stream(buffer)
+        
+        self.assertTrue(load_result["success"])
+        self.assertEqual(new_voting_system.to_dict(), self.voting_system.to_dict())
+    
+    def _assert_stream_round_trip(self):
+        """Save the fixture's state and load it back under every available codec."""
+        for name, codec in CODECS:
+            with self.subTest(codec=name), mock.patch.object(_json, "orjson", codec):
+                buffer = io.BytesIO()
+                self.assertTrue(self.voting_system.save_state_to_stream(buffer)["success"])
+                buffer.seek(0)
+                new_voting_system = VotingSystem()
+                load_result = new_voting_system.load_state_from_stream(buffer)
+                
+                self.assertTrue(load_result["success"])
+                self.assertEqual(new_voting_system.to_dict(), self.voting_system.to_dict())
+    
+    def test_save_and_load_state_non_finite_timestamp(self):
+        """Test a non-finite vote timestamp survives a state round trip."""
+        self.voting_system.register_voter("voter1")
+        with mock.patch.object(time, "time", return_value=float("inf")):
+            self.assertTrue(self.voting_system.cast_vote("voter1", "candidate_a")["success"])
+        
+        self._assert_stream_round_trip()
+    
+    def test_save_and_load_state_lone_surrogate(self):
+        """Test a voter_id containing a lone surrogate survives a state round trip."""
+        self._seed({"voter\ud800": "candidate_a"})
+        
+        self._assert_stream_round_trip()
+    
+    def test_load_state_invalid_json_stdlib(self):
+        """Test invalid JSON maps to LOAD_ERROR with the stdlib codec too."""
+        with mock.patch.object(_json, "orjson", None):
+            result = self.voting_system.load_state_from_stream(io.BytesIO(b"invalid json content {"))
+        
+        self.assertFalse(result["success"])
+        self.assertEqual(result["error"], "LOAD_ERROR")
+    
+    def test_load_state_stream_invalid_json(self):
+        """Test loading invalid JSON from a stream fails without changing state."""
+        self.voting_system.register_voter("voter1")
+        
+        result = self.voting_system.load_state_from_stream(io.BytesIO(b"invalid json content {"))
+        
+        self.assertFalse(result["success"])
+        self.assertEqual(result["error"], "LOAD_ERROR")
+        self.assertEqual(self.voting_system.get_registered_voters(), ["voter1"])
     
     def test_serialization_round_trip(self):
         """Test to_dict and from_dict methods."""